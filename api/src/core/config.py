@@ -59,6 +59,12 @@ class Settings(BaseSettings):
     max_temp_dir_age_hours: int = 1  # Remove temp files older than 1 hour
     max_temp_dir_count: int = 3  # Maximum number of temp files to keep
 
+    # Debug Endpoint Settings
+    debug_metrics_ttl_sec: float = 3.0  # How long /debug/system and /debug/storage payloads are cached
+    debug_connections_ttl_sec: float = 15.0  # How long the /debug/system socket count is cached
+    debug_partitions_ttl_sec: float = 60.0  # How long the /debug/storage partition list is cached
+    debug_gpu_ttl_sec: float = 1.0  # How long the GPU stats shared by debug endpoints are cached
+
     class Config:
         env_file = ".env"
 
@@ -22,6 +22,10 @@ class PyTorchConfig(BaseModel):
 
     memory_threshold: float = Field(0.8, description="Memory threshold for cleanup")
     retry_on_oom: bool = Field(True, description="Whether to retry on OOM errors")
+    aggressive_cache_clear: bool = Field(
+        False,
+        description="Whether to empty the CUDA cache before each generation",
+    )
 
     class Config:
         frozen = True
@@ -1,8 +1,11 @@
 """Async file and path operations."""
 
+import asyncio
+import contextlib
 import io
 import json
 import os
+import tempfile
 from pathlib import Path
 from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
 
@@ -13,6 +16,9 @@ from loguru import logger
 
 from .config import settings
 
+# Api directory path (two levels up from core), resolved once at import
+_API_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
 
 async def _find_file(
     filename: str,
@@ -87,11 +93,8 @@ async def get_model_path(model_name: str) -> str:
     Raises:
         RuntimeError: If model not found
     """
-    # Get api directory path (two levels up from core)
-    api_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-
     # Construct model directory path relative to api directory
-    model_dir = os.path.join(api_dir, settings.model_dir)
+    model_dir = os.path.join(_API_DIR, settings.model_dir)
 
     # Ensure model directory exists
     os.makedirs(model_dir, exist_ok=True)
@@ -115,11 +118,8 @@ async def get_voice_path(voice_name: str) -> str:
     Raises:
         RuntimeError: If voice not found
     """
-    # Get api directory path
-    api_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-
     # Construct voice directory path relative to api directory
-    voice_dir = os.path.join(api_dir, settings.voices_dir)
+    voice_dir = os.path.join(_API_DIR, settings.voices_dir)
 
     # Ensure voice directory exists
     os.makedirs(voice_dir, exist_ok=True)
@@ -139,11 +139,8 @@ async def list_voices() -> List[str]:
     Returns:
         List of voice names (without .pt extension)
     """
-    # Get api directory path
-    api_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-
     # Construct voice directory path relative to api directory
-    voice_dir = os.path.join(api_dir, settings.voices_dir)
+    voice_dir = os.path.join(_API_DIR, settings.voices_dir)
 
     # Ensure voice directory exists
     os.makedirs(voice_dir, exist_ok=True)
@@ -160,13 +157,15 @@ async def list_voices() -> List[str]:
 
 
 async def load_voice_tensor(
-    voice_path: str, device: str = "cpu", weights_only=False
+    voice_path: str, device: str = "cpu", weights_only=False, mmap=False
 ) -> torch.Tensor:
     """Load voice tensor from file.
 
     Args:
         voice_path: Path to voice file
         device: Device to load tensor to
+        weights_only: Whether to restrict unpickling to tensors and primitives
+        mmap: Whether to memory-map the file instead of reading it into memory
 
     Returns:
         Voice tensor
@@ -175,6 +174,15 @@ async def load_voice_tensor(
         RuntimeError: If file cannot be read
     """
     try:
+        if mmap:
+            # torch.load needs the real file to map it, so run it off the event loop
+            return await asyncio.to_thread(
+                torch.load,
+                voice_path,
+                map_location=device,
+                weights_only=weights_only,
+                mmap=True,
+            )
         async with aiofiles.open(voice_path, "rb") as f:
             data = await f.read()
             return torch.load(
@@ -184,9 +192,25 @@ async def load_voice_tensor(
         raise RuntimeError(f"Failed to load voice tensor from {voice_path}: {e}")
 
 
+def _write_tensor_atomic(tensor: torch.Tensor, path: str) -> None:
+    """Write tensor to a unique file beside path, then rename it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".pt.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            torch.save(tensor, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
 async def save_voice_tensor(tensor: torch.Tensor, voice_path: str) -> None:
     """Save voice tensor to file.
 
+    The file is replaced atomically, so concurrent writers of the same path
+    never leave a truncated file for a reader that already opened it.
+
     Args:
         tensor: Voice tensor to save
         voice_path: Path to save voice file
@@ -195,10 +219,8 @@ async def save_voice_tensor(tensor: torch.Tensor, voice_path: str) -> None:
         RuntimeError: If file cannot be written
     """
     try:
-        buffer = io.BytesIO()
-        torch.save(tensor, buffer)
-        async with aiofiles.open(voice_path, "wb") as f:
-            await f.write(buffer.getvalue())
+        # Serialize and write off the event loop, large tensors can take a while
+        await asyncio.to_thread(_write_tensor_atomic, tensor, voice_path)
     except Exception as e:
         raise RuntimeError(f"Failed to save voice tensor to {voice_path}: {e}")
 
@@ -1,7 +1,7 @@
 """GPU instance pool and request queue management."""
 
 import asyncio
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 import torch
 from loguru import logger
 
@@ -82,6 +82,16 @@ class InstancePool:
         # Start request processor
         asyncio.create_task(self._process_queue())
     
+    def snapshot(self) -> List[Tuple[int, int, bool]]:
+        """Get (instance_id, device_id, is_busy) for all instances in one pass.
+
+        Nothing is awaited, so the result is consistent within the event loop.
+        """
+        return [
+            (instance.instance_id, instance.device_id, instance.is_busy)
+            for instance in self.instances
+        ]
+
     def get_next_available_instance(self) -> Optional[GPUInstance]:
         """Get next available GPU instance using round-robin."""
         start_idx = self.current_instance_idx
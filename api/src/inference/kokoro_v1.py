@@ -101,8 +101,13 @@ class KokoroV1(BaseModelBackend):
             raise RuntimeError("Model not loaded")
 
         try:
-            # Memory management for GPU
-            if self._device == "cuda":
+            # Memory management for GPU. empty_cache() syncs the device and only
+            # releases unused cached blocks, so it is opt-in here; the OOM retry
+            # path below still clears memory when it actually matters.
+            if (
+                self._device == "cuda"
+                and model_config.pytorch_gpu.aggressive_cache_clear
+            ):
                 if self._check_memory():
                     self._clear_memory()
 
@@ -200,8 +205,13 @@ class KokoroV1(BaseModelBackend):
         if not self.is_loaded:
             raise RuntimeError("Model not loaded")
         try:
-            # Memory management for GPU
-            if self._device == "cuda":
+            # Memory management for GPU. empty_cache() syncs the device and only
+            # releases unused cached blocks, so it is opt-in here; the OOM retry
+            # path below still clears memory when it actually matters.
+            if (
+                self._device == "cuda"
+                and model_config.pytorch_gpu.aggressive_cache_clear
+            ):
                 if self._check_memory():
                     self._clear_memory()
 
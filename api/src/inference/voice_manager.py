@@ -1,6 +1,11 @@
 """Voice management with controlled resource handling."""
 
-from typing import Dict, List, Optional
+import asyncio
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from weakref import WeakValueDictionary
 
 import aiofiles
 import torch
@@ -8,6 +13,23 @@ from loguru import logger
 
 from ..core import paths
 from ..core.config import settings
+from ..core.model_config import model_config
+
+# Resolved once at import rather than on every lookup
+_API_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+_VOICES_DIR = os.path.join(_API_DIR, settings.voices_dir)
+
+# Voices loaded by any VoiceManager, keyed by (voice_path, device). Entries drop
+# out once no manager cache or caller holds the tensor any more.
+_shared_voices: "WeakValueDictionary[Tuple[str, str], torch.Tensor]" = (
+    WeakValueDictionary()
+)
+
+
+@lru_cache(maxsize=512)
+def _resolve_voice_path(voices_dir: str, voice_name: str) -> str:
+    """Build the path to a voice file, memoized per (directory, name)."""
+    return os.path.join(voices_dir, f"{voice_name}.pt")
 
 
 class VoiceManager:
@@ -20,7 +42,31 @@ class VoiceManager:
         """Initialize voice manager."""
         # Strictly respect settings.use_gpu
         self._device = "cuda" if settings.use_gpu else "cpu"
-        self._voices: Dict[str, torch.Tensor] = {}
+        # Keyed by (voice_name, device), or ("+", joined_names, device) for blends
+        self._voice_cache: "OrderedDict[Tuple[str, ...], torch.Tensor]" = OrderedDict()
+        # Loads currently in progress, shared by concurrent requests for a voice
+        self._inflight: Dict[Tuple[str, str], "asyncio.Future[torch.Tensor]"] = {}
+
+        self._voices_dir = _VOICES_DIR
+        os.makedirs(self._voices_dir, exist_ok=True)
+
+        # In-memory index of voice names so lookups don't stat the filesystem
+        self._voice_index: Set[str] = set()
+        self._voice_index_mtime: Optional[float] = None
+
+    def _refresh_voice_index(self) -> None:
+        """Rescan the voices directory if it changed since the last scan."""
+        mtime = os.stat(self._voices_dir).st_mtime
+        if mtime == self._voice_index_mtime:
+            return
+        with os.scandir(self._voices_dir) as entries:
+            # DirEntry.is_file() uses the type cached by scandir, no extra stat
+            self._voice_index = {
+                entry.name[:-3]
+                for entry in entries
+                if entry.name[-3:] == ".pt" and entry.is_file()
+            }
+        self._voice_index_mtime = mtime
 
     async def get_voice_path(self, voice_name: str) -> str:
         """Get path to voice file.
@@ -32,9 +78,16 @@ class VoiceManager:
             Path to voice file
 
         Raises:
-            RuntimeError: If voice not found
+            FileNotFoundError: If voice not found
         """
-        return await paths.get_voice_path(voice_name)
+        if voice_name not in self._voice_index:
+            # Only touch the filesystem on a miss, in case the voice was added
+            await asyncio.to_thread(self._refresh_voice_index)
+            if voice_name not in self._voice_index:
+                raise FileNotFoundError(
+                    f"File not found: {voice_name}.pt in paths: {[self._voices_dir]}"
+                )
+        return _resolve_voice_path(self._voices_dir, voice_name)
 
     async def load_voice(
         self, voice_name: str, device: Optional[str] = None
@@ -51,15 +104,50 @@ class VoiceManager:
         Raises:
             RuntimeError: If voice not found
         """
+        # Fast path: cache hits are keyed by name so they skip path resolution
+        target_device = device or self._device
+        cache_key = (voice_name, target_device)
+        cached = self._voice_cache.get(cache_key)
+        if cached is not None:
+            self._voice_cache.move_to_end(cache_key)
+            return cached
+
         try:
             voice_path = await self.get_voice_path(voice_name)
-            target_device = device or self._device
-            voice = await paths.load_voice_tensor(voice_path, target_device)
-            self._voices[voice_name] = voice
+
+            shared_key = (voice_path, target_device)
+            voice = _shared_voices.get(shared_key)
+            if voice is None:
+                load = self._inflight.get(cache_key)
+                if load is None:
+                    load = asyncio.ensure_future(
+                        paths.load_voice_tensor(
+                            voice_path,
+                            device=target_device,
+                            weights_only=True,
+                            mmap=True,
+                        )
+                    )
+                    self._inflight[cache_key] = load
+                    load.add_done_callback(
+                        lambda _: self._inflight.pop(cache_key, None)
+                    )
+                # Shield so one cancelled waiter doesn't cancel the shared load
+                voice = await asyncio.shield(load)
+                _shared_voices[shared_key] = voice
+
+            if model_config.cache_voices:
+                self._voice_cache[cache_key] = voice
+                self._manage_cache()
             return voice
         except Exception as e:
             raise RuntimeError(f"Failed to load voice {voice_name}: {e}")
 
+    def _manage_cache(self) -> None:
+        """Evict least recently used voices once the cache is over capacity."""
+        while len(self._voice_cache) > model_config.voice_cache_size:
+            self._voice_cache.popitem(last=False)
+
     async def combine_voices(
         self, voices: List[str], device: Optional[str] = None
     ) -> torch.Tensor:
@@ -79,12 +167,27 @@ class VoiceManager:
             raise ValueError("Need at least 2 voices to combine")
 
         target_device = device or self._device
-        voice_tensors = []
-        for name in voices:
-            voice = await self.load_voice(name, target_device)
-            voice_tensors.append(voice)
 
-        combined = torch.mean(torch.stack(voice_tensors), dim=0)
+        # Averaging is order independent, so "a+b" and "b+a" share one entry.
+        # The "+" prefix keeps blends apart from voices loaded by name.
+        cache_key = ("+", "+".join(sorted(voices)), target_device)
+        if cache_key in self._voice_cache:
+            self._voice_cache.move_to_end(cache_key)
+            return self._voice_cache[cache_key]
+
+        voice_tensors = await asyncio.gather(
+            *(self.load_voice(name, target_device) for name in voices)
+        )
+
+        # Accumulate in place rather than stacking into an (N, ...) intermediate
+        combined = torch.zeros_like(voice_tensors[0])
+        for voice in voice_tensors:
+            combined.add_(voice)
+        combined.div_(len(voice_tensors))
+
+        if model_config.cache_voices:
+            self._voice_cache[cache_key] = combined
+            self._manage_cache()
         return combined
 
     async def list_voices(self) -> List[str]:
@@ -93,7 +196,8 @@ class VoiceManager:
         Returns:
             List of voice names
         """
-        return await paths.list_voices()
+        await asyncio.to_thread(self._refresh_voice_index)
+        return sorted(self._voice_index)
 
     def cache_info(self) -> Dict[str, int]:
         """Get cache statistics.
@@ -101,7 +205,7 @@ class VoiceManager:
         Returns:
             Dict with cache statistics
         """
-        return {"loaded_voices": len(self._voices), "device": self._device}
+        return {"loaded_voices": len(self._voice_cache), "device": self._device}
 
 
 async def get_manager() -> VoiceManager:
@@ -1,49 +1,292 @@
+import asyncio
+import atexit
 import threading
 import time
 from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
 
 import psutil
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
+from loguru import logger
+
+from ..core.config import settings
+from ..inference.instance_pool import InstancePool
+from ..inference.model_manager import get_manager
+
+try:
+    import pynvml
+
+    NVML_AVAILABLE = True
+except ImportError:
+    NVML_AVAILABLE = False
 
 try:
     import GPUtil
 
-    GPU_AVAILABLE = True
+    GPUTIL_AVAILABLE = True
 except ImportError:
-    GPU_AVAILABLE = False
+    GPUTIL_AVAILABLE = False
+
+GPU_AVAILABLE = NVML_AVAILABLE or GPUTIL_AVAILABLE
+
+# Debug payloads are large nested dicts of floats, orjson encodes them much faster
+router = APIRouter(tags=["debug"], default_response_class=ORJSONResponse)
+
+# Byte conversion factors, applied as multiplications
+_INV_MB = 1.0 / (1024 * 1024)
+_INV_GB = 1.0 / (1024**3)
+
+_enumerate_threads = threading.enumerate
+
+# Handle for this server process, reused across requests
+_PROC = psutil.Process()
+
+# Fixed for the lifetime of the process, so formatted once at import
+_PID = _PROC.pid
+_CREATE_TIME_ISO = datetime.fromtimestamp(_PROC.create_time()).isoformat()
+
+
+class _TTLCache:
+    """Short-lived cache of debug payloads, so frequent polling reuses one sample."""
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    async def get_or_compute(
+        self, key: Hashable, ttl: float, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached payload for key, recomputing it once expired.
+
+        Concurrent callers for the same key wait on one computation.
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+
+        # Keys come from query parameters, so drop stale ones on every miss
+        self._prune(now)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+
+        async with lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            payload = await compute()
+            self._entries[key] = (time.monotonic() + ttl, payload)
+            return payload
+
+    def _prune(self, now: float) -> None:
+        """Drop expired payloads, and the locks of keys nobody is computing."""
+        for key in [k for k, (expires, _) in self._entries.items() if now >= expires]:
+            del self._entries[key]
+        for key in [
+            k
+            for k, lock in self._locks.items()
+            if k not in self._entries and not lock.locked()
+        ]:
+            del self._locks[key]
+
+
+_metrics_cache = _TTLCache()
+
+# NVML device handles, looked up once on first use. A failed setup is
+# remembered so driverless hosts fall back to GPUtil without retrying.
+_nvml_handles: Optional[List[Any]] = None
+_nvml_failed = False
+
+
+def _get_nvml_handles() -> Optional[List[Any]]:
+    """Initialize NVML once and return the cached per-device handles.
+
+    Returns:
+        Per-device handles, or None if NVML is missing or failed to initialize
+    """
+    global _nvml_handles, _nvml_failed
+    if _nvml_handles is None and NVML_AVAILABLE and not _nvml_failed:
+        initialized = False
+        try:
+            pynvml.nvmlInit()
+            initialized = True
+            handles = [
+                pynvml.nvmlDeviceGetHandleByIndex(i)
+                for i in range(pynvml.nvmlDeviceGetCount())
+            ]
+        except Exception as e:
+            _nvml_failed = True
+            logger.warning(f"NVML unavailable, falling back to GPUtil: {e}")
+            if initialized:
+                pynvml.nvmlShutdown()
+            return None
+        atexit.register(pynvml.nvmlShutdown)
+        _nvml_handles = handles
+    return _nvml_handles
+
+
+def _gpu_entry(
+    gpu_id: int,
+    name: str,
+    load: float,
+    total_mb: float,
+    used_mb: float,
+    free_mb: float,
+    temperature: float,
+) -> Dict[str, Any]:
+    """Build the canonical per-GPU dict shared by the debug endpoints."""
+    return {
+        "id": gpu_id,
+        "name": name,
+        "load": load,
+        "memory": {
+            "total": total_mb,
+            "used": used_mb,
+            "free": free_mb,
+            "percent": (used_mb / total_mb) * 100,
+        },
+        "temperature": temperature,
+    }
+
+
+def _read_gpus() -> Optional[List[Dict[str, Any]]]:
+    """Read per-GPU stats, memory in MB and load as a 0-1 fraction like GPUtil.
 
-router = APIRouter(tags=["debug"])
+    Returns:
+        Per-GPU stats, or None if neither NVML nor GPUtil can be used
+    """
+    handles = _get_nvml_handles()
+    if handles is None:
+        if not GPUTIL_AVAILABLE:
+            # e.g. pynvml installed on a driverless host, report no GPUs as before
+            return None
+        return [
+            _gpu_entry(
+                gpu.id,
+                gpu.name,
+                gpu.load,
+                gpu.memoryTotal,
+                gpu.memoryUsed,
+                gpu.memoryFree,
+                gpu.temperature,
+            )
+            for gpu in GPUtil.getGPUs()
+        ]
+
+    gpus = []
+    for index, handle in enumerate(handles):
+        memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        name = pynvml.nvmlDeviceGetName(handle)
+        gpus.append(
+            _gpu_entry(
+                index,
+                # Older pynvml releases return bytes
+                name.decode() if isinstance(name, bytes) else name,
+                pynvml.nvmlDeviceGetUtilizationRates(handle).gpu / 100,
+                memory.total * _INV_MB,
+                memory.used * _INV_MB,
+                memory.free * _INV_MB,
+                pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU),
+            )
+        )
+    return gpus
+
+
+# Last GPU readings, shared by /debug/system and /debug/session_pools so
+# dashboards polling both walk the devices once per debug_gpu_ttl_sec
+_gpu_snapshot_cache: Dict[str, Any] = {"ts": None, "value": None}
+
+
+def _gpu_snapshot() -> Optional[List[Dict[str, Any]]]:
+    """Return per-GPU stats, re-reading the devices once the cache expires."""
+    now = time.monotonic()
+    if (
+        _gpu_snapshot_cache["ts"] is None
+        or now - _gpu_snapshot_cache["ts"] > settings.debug_gpu_ttl_sec
+    ):
+        _gpu_snapshot_cache["value"] = _read_gpus()
+        _gpu_snapshot_cache["ts"] = now
+    return _gpu_snapshot_cache["value"]
+
+
+# Last process socket count, refreshed at most every debug_connections_ttl_sec
+_conn_cache: Dict[str, Optional[float]] = {"ts": None, "value": None}
+
+# Mounted partitions only change on mount/unmount, refreshed every
+# debug_partitions_ttl_sec
+_partitions_cache: Dict[str, Any] = {"ts": None, "value": None}
+
+# Pseudo and image filesystems, skipped up front rather than failing disk_usage()
+_SKIP_FSTYPES = frozenset(
+    {
+        "autofs",
+        "cgroup",
+        "cgroup2",
+        "devtmpfs",
+        "proc",
+        "squashfs",
+        "sysfs",
+        "tmpfs",
+    }
+)
 
 
 @router.get("/debug/threads")
 async def get_thread_info():
-    process = psutil.Process()
-    current_threads = threading.enumerate()
+    process = _PROC
+    current_threads = _enumerate_threads()
 
-    # Get per-thread CPU times
-    thread_details = []
-    for thread in current_threads:
-        thread_info = {
+    # Get per-thread details. threading.enumerate() only returns threads that
+    # have started and not yet finished, so every entry is alive by definition.
+    thread_details = [
+        {
             "name": thread.name,
             "id": thread.ident,
-            "alive": thread.is_alive(),
+            "alive": True,
             "daemon": thread.daemon,
         }
-        thread_details.append(thread_info)
+        for thread in current_threads
+    ]
+
+    # Batch the /proc reads for this process into a single pass
+    with process.oneshot():
+        total_threads = process.num_threads()
+        memory_mb = process.memory_info().rss * _INV_MB
 
     return {
-        "total_threads": process.num_threads(),
+        "total_threads": total_threads,
         "active_threads": len(current_threads),
-        "thread_names": [t.name for t in current_threads],
+        "thread_names": [t["name"] for t in thread_details],
         "thread_details": thread_details,
-        "memory_mb": process.memory_info().rss / 1024 / 1024,
+        "memory_mb": memory_mb,
     }
 
 
 @router.get("/debug/storage")
 async def get_storage_info():
+    return await _metrics_cache.get_or_compute(
+        "storage",
+        settings.debug_metrics_ttl_sec,
+        lambda: asyncio.to_thread(_collect_storage_info),
+    )
+
+
+def _collect_storage_info():
     # Get disk partitions
-    partitions = psutil.disk_partitions()
+    now = time.monotonic()
+    if (
+        _partitions_cache["ts"] is None
+        or now - _partitions_cache["ts"] > settings.debug_partitions_ttl_sec
+    ):
+        _partitions_cache["value"] = [
+            partition
+            for partition in psutil.disk_partitions()
+            if partition.fstype not in _SKIP_FSTYPES
+        ]
+        _partitions_cache["ts"] = now
+    partitions = _partitions_cache["value"]
     storage_info = []
 
     for partition in partitions:
@@ -54,9 +297,9 @@ async def get_storage_info():
                     "device": partition.device,
                     "mountpoint": partition.mountpoint,
                     "fstype": partition.fstype,
-                    "total_gb": usage.total / (1024**3),
-                    "used_gb": usage.used / (1024**3),
-                    "free_gb": usage.free / (1024**3),
+                    "total_gb": usage.total * _INV_GB,
+                    "used_gb": usage.used * _INV_GB,
+                    "free_gb": usage.free * _INV_GB,
                     "percent_used": usage.percent,
                 }
             )
@@ -67,14 +310,59 @@ async def get_storage_info():
 
 
 @router.get("/debug/system")
-async def get_system_info():
-    process = psutil.Process()
+async def get_system_info(
+    include_connections: bool = False,
+    cpu_sample_sec: float = Query(0.1, gt=0.0, le=5.0),
+    per_cpu: bool = False,
+):
+    """Get system resource usage.
+
+    CPU usage is averaged over cpu_sample_sec. Longer windows smooth out
+    bursts but hold the response for that long; the default suits polling.
+    Per-core usage is only reported when per_cpu is set.
+    """
+    return await _metrics_cache.get_or_compute(
+        ("system", include_connections, cpu_sample_sec, per_cpu),
+        settings.debug_metrics_ttl_sec,
+        lambda: _sample_system_info(include_connections, cpu_sample_sec, per_cpu),
+    )
+
 
-    # CPU Info
+async def _sample_system_info(
+    include_connections: bool, cpu_sample_sec: float, per_cpu: bool
+):
+    # Each request measures its own window with a blocking cpu_percent(interval)
+    # in a worker thread. The interval=None form keeps one baseline per thread,
+    # so overlapping requests sampling on the event loop would reset each
+    # other's windows. The per-core list is large on many-core hosts, so it is
+    # opt-in and sampled alongside the total.
+    cpu_sample = asyncio.to_thread(psutil.cpu_percent, interval=cpu_sample_sec)
+    if per_cpu:
+        cpu_percent, per_cpu_percent = await asyncio.gather(
+            cpu_sample,
+            asyncio.to_thread(psutil.cpu_percent, interval=cpu_sample_sec, percpu=True),
+        )
+    else:
+        cpu_percent, per_cpu_percent = await cpu_sample, None
+
+    # The remaining psutil calls hit /proc synchronously, keep them off the loop
+    return await asyncio.to_thread(
+        _collect_system_info, include_connections, cpu_percent, per_cpu_percent
+    )
+
+
+def _collect_system_info(
+    include_connections: bool,
+    cpu_percent: float,
+    per_cpu_percent: Optional[List[float]],
+):
+    process = _PROC
+
+    # CPU Info, with usage sampled by the caller
     cpu_info = {
         "cpu_count": psutil.cpu_count(),
-        "cpu_percent": psutil.cpu_percent(interval=1),
-        "per_cpu_percent": psutil.cpu_percent(interval=1, percpu=True),
+        "cpu_percent": cpu_percent,
+        "per_cpu_percent": per_cpu_percent,
         "load_avg": psutil.getloadavg(),
     }
 
@@ -83,54 +371,63 @@ async def get_system_info():
     swap_memory = psutil.swap_memory()
     memory_info = {
         "virtual": {
-            "total_gb": virtual_memory.total / (1024**3),
-            "available_gb": virtual_memory.available / (1024**3),
-            "used_gb": virtual_memory.used / (1024**3),
+            "total_gb": virtual_memory.total * _INV_GB,
+            "available_gb": virtual_memory.available * _INV_GB,
+            "used_gb": virtual_memory.used * _INV_GB,
             "percent": virtual_memory.percent,
         },
         "swap": {
-            "total_gb": swap_memory.total / (1024**3),
-            "used_gb": swap_memory.used / (1024**3),
-            "free_gb": swap_memory.free / (1024**3),
+            "total_gb": swap_memory.total * _INV_GB,
+            "used_gb": swap_memory.used * _INV_GB,
+            "free_gb": swap_memory.free * _INV_GB,
             "percent": swap_memory.percent,
         },
     }
 
-    # Process Info
-    process_info = {
-        "pid": process.pid,
-        "status": process.status(),
-        "create_time": datetime.fromtimestamp(process.create_time()).isoformat(),
-        "cpu_percent": process.cpu_percent(),
-        "memory_percent": process.memory_percent(),
-    }
+    # Process Info, batching the /proc reads for this process into a single pass
+    with process.oneshot():
+        process_info = {
+            "pid": _PID,
+            "status": process.status(),
+            "create_time": _CREATE_TIME_ISO,
+            "cpu_percent": process.cpu_percent(),
+            "memory_percent": process.memory_percent(),
+        }
+
+    # Network Info. Listing sockets walks every open fd of the process, so the
+    # count is opt-in and only refreshed every debug_connections_ttl_sec.
+    connections = None
+    if include_connections:
+        now = time.monotonic()
+        if (
+            _conn_cache["ts"] is None
+            or now - _conn_cache["ts"] > settings.debug_connections_ttl_sec
+        ):
+            _conn_cache["value"] = len(process.net_connections())
+            _conn_cache["ts"] = now
+        connections = _conn_cache["value"]
 
-    # Network Info
+    # Spelled out rather than namedtuple._asdict(), which reflects over _fields
+    net_io = psutil.net_io_counters()
     network_info = {
-        "connections": len(process.net_connections()),
-        "network_io": psutil.net_io_counters()._asdict(),
+        "connections": connections,
+        "network_io": {
+            "bytes_sent": net_io.bytes_sent,
+            "bytes_recv": net_io.bytes_recv,
+            "packets_sent": net_io.packets_sent,
+            "packets_recv": net_io.packets_recv,
+            "errin": net_io.errin,
+            "errout": net_io.errout,
+            "dropin": net_io.dropin,
+            "dropout": net_io.dropout,
+        },
     }
 
     # GPU Info if available
     gpu_info = None
     if GPU_AVAILABLE:
         try:
-            gpus = GPUtil.getGPUs()
-            gpu_info = [
-                {
-                    "id": gpu.id,
-                    "name": gpu.name,
-                    "load": gpu.load,
-                    "memory": {
-                        "total": gpu.memoryTotal,
-                        "used": gpu.memoryUsed,
-                        "free": gpu.memoryFree,
-                        "percent": (gpu.memoryUsed / gpu.memoryTotal) * 100,
-                    },
-                    "temperature": gpu.temperature,
-                }
-                for gpu in gpus
-            ]
+            gpu_info = _gpu_snapshot()
         except Exception:
             gpu_info = "GPU information unavailable"
 
@@ -146,7 +443,6 @@ async def get_system_info():
 @router.get("/debug/config")
 async def get_config_info():
     """Get information about the current configuration."""
-    from ..core.config import settings
     from ..inference.kokoro_v1 import LANG_CODES
     
     # Get the default voice code
@@ -175,11 +471,29 @@ async def get_config_info():
     }
 
 
+@router.get("/debug/model_pool")
+async def get_model_pool_info():
+    """Get information about the GPU model instance pool."""
+    pool = InstancePool._instance
+    if pool is None:
+        return {"initialized": False}
+
+    instances = [
+        {"instance_id": instance_id, "device_id": device_id, "busy": busy}
+        for instance_id, device_id, busy in pool.snapshot()
+    ]
+    return {
+        "initialized": True,
+        "total_instances": len(instances),
+        "busy_instances": sum(instance["busy"] for instance in instances),
+        "queued_requests": pool.request_queue.qsize(),
+        "instances": instances,
+    }
+
+
 @router.get("/debug/session_pools")
 async def get_session_pool_info():
     """Get information about ONNX session pools."""
-    from ..inference.model_manager import get_manager
-
     manager = await get_manager()
     pools = manager._session_pools
     current_time = time.time()
@@ -218,14 +532,14 @@ async def get_session_pool_info():
         # Add GPU memory info if available
         if GPU_AVAILABLE:
             try:
-                gpus = GPUtil.getGPUs()
+                gpus = _gpu_snapshot()
                 if gpus:
-                    gpu = gpus[0]  # Assume first GPU
+                    memory = gpus[0]["memory"]  # Assume first GPU
                     pool_info["gpu"]["memory"] = {
-                        "total_mb": gpu.memoryTotal,
-                        "used_mb": gpu.memoryUsed,
-                        "free_mb": gpu.memoryFree,
-                        "percent_used": (gpu.memoryUsed / gpu.memoryTotal) * 100,
+                        "total_mb": memory["total"],
+                        "used_mb": memory["used"],
+                        "free_mb": memory["free"],
+                        "percent_used": memory["percent"],
                     }
             except Exception:
                 pass
@@ -1,6 +1,5 @@
 """OpenAI-compatible router for text-to-speech"""
 
-import io
 import json
 import os
 import re
@@ -9,15 +8,13 @@ from typing import AsyncGenerator, Dict, List, Union, Tuple, Optional
 from urllib import response
 import numpy as np
 
-import aiofiles
-
 from structures.schemas import CaptionedSpeechRequest
-import torch
 from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
 from fastapi.responses import FileResponse, StreamingResponse
 from loguru import logger
 
 from ..inference.base import AudioChunk
+from ..core import paths
 from ..core.config import settings
 from ..core.auth import verify_api_key
 from ..services.audio import AudioService
@@ -595,10 +592,7 @@ async def combine_voices(
         # Save to temp file
         temp_dir = tempfile.gettempdir()
         voice_path = os.path.join(temp_dir, f"{combined_name}.pt")
-        buffer = io.BytesIO()
-        torch.save(combined_tensor, buffer)
-        async with aiofiles.open(voice_path, "wb") as f:
-            await f.write(buffer.getvalue())
+        await paths.save_voice_tensor(combined_tensor, voice_path)
 
         return FileResponse(
             voice_path,
@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import re
 import tempfile
 import time
 from typing import AsyncGenerator, List, Optional, Tuple, Union, Dict
@@ -23,6 +24,39 @@ from ..structures.schemas import NormalizationOptions
 from ..core import paths
 from ..inference.instance_pool import InstancePool
 
+# Pre-compiled pattern for one "name" or "name(weight)" term of a combined voice,
+# where weight is a float literal such as 2, 0.5 or 1e-3
+VOICE_TERM_PATTERN = re.compile(
+    r"[\s+]*([^\s+()]+)\s*"
+    r"(?:\(\s*(-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*\))?"
+    r"\s*(?:\+[\s+]*|$)"
+)
+
+
+def _parse_voice_formula(voice: str) -> List[Tuple[str, float]]:
+    """Parse a combined voice string into (voice name, weight) pairs.
+
+    Args:
+        voice: Combined voice string (e.g., 'af_bella(2)+af_sky')
+
+    Returns:
+        List of (voice name, weight) tuples, weight defaulting to 1.0
+
+    Raises:
+        RuntimeError: If the string is not a valid combined voice
+    """
+    terms = []
+    pos = 0
+    while pos < len(voice):
+        match = VOICE_TERM_PATTERN.match(voice, pos)
+        if not match:
+            raise RuntimeError(f"Invalid combined voice name: {voice}")
+        name, weight = match.groups()
+        terms.append((name, float(weight) if weight else 1.0))
+        pos = match.end()
+    return terms
+
+
 class TTSService:
     """Text-to-speech service."""
 
@@ -190,22 +224,10 @@ class TTSService:
         try:
             # Check if it's a combined voice
             if "+" in voice:
-                # Split on + but preserve any parentheses
-                voice_parts = []
-                weights = []
-                for part in voice.split("+"):
-                    part = part.strip()
-                    if not part:
-                        continue
-                    # Extract voice name and weight if present
-                    if "(" in part and ")" in part:
-                        voice_name = part.split("(")[0].strip()
-                        weight = float(part.split("(")[1].split(")")[0])
-                    else:
-                        voice_name = part
-                        weight = 1.0
-                    voice_parts.append(voice_name)
-                    weights.append(weight)
+                # Extract voice names and optional weights in a single pass
+                terms = _parse_voice_formula(voice)
+                voice_parts = [name for name, _ in terms]
+                weights = [weight for _, weight in terms]
 
                 if len(voice_parts) < 2:
                     raise RuntimeError(f"Invalid combined voice name: {voice}")
@@ -214,27 +236,32 @@ class TTSService:
                 total_weight = sum(weights)
                 weights = [w / total_weight for w in weights]
 
-                # Load and combine voices
-                voice_tensors = []
+                # Load and combine voices, accumulating the weighted sum in place
+                logger.debug(
+                    f"Combining {len(voice_parts)} voice tensors with weights {weights}"
+                )
+                combined = None
                 for v, w in zip(voice_parts, weights):
                     path = await self.voice_manager.get_voice_path(v)
                     if not path:
                         raise RuntimeError(f"Voice not found: {v}")
                     logger.debug(f"Loading voice tensor from: {path}")
                     voice_tensor = torch.load(path, map_location="cpu")
-                    voice_tensors.append(voice_tensor * w)
-
-                # Sum the weighted voice tensors
-                logger.debug(
-                    f"Combining {len(voice_tensors)} voice tensors with weights {weights}"
+                    if combined is None:
+                        combined = torch.zeros_like(voice_tensor)
+                    combined.add_(voice_tensor, alpha=w)
+
+                # Save combined tensor under an order independent name, so
+                # "a+b" and "b+a" reuse the same file. Weights keep full
+                # precision, since the pipeline caches voices by path.
+                canonical_name = "+".join(
+                    name if weight == 1.0 else f"{name}({weight!r})"
+                    for name, weight in sorted(terms)
                 )
-                combined = torch.sum(torch.stack(voice_tensors), dim=0)
-
-                # Save combined tensor
                 temp_dir = tempfile.gettempdir()
-                combined_path = os.path.join(temp_dir, f"{voice}.pt")
+                combined_path = os.path.join(temp_dir, f"{canonical_name}.pt")
                 logger.debug(f"Saving combined voice to: {combined_path}")
-                torch.save(combined, combined_path)
+                await paths.save_voice_tensor(combined, combined_path)
 
                 return voice, combined_path
             else:
@@ -331,7 +358,7 @@ class TTSService:
 
     async def list_voices(self) -> List[str]:
         """List available voices."""
-        return await paths.list_voices()
+        return await self.voice_manager.list_voices()
 
     async def generate_from_phonemes(
         self,
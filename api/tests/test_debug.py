@@ -0,0 +1,164 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.src.inference.instance_pool import GPUInstance, InstancePool
+from api.src.routers import debug
+
+
+@pytest.mark.asyncio
+async def test_overlapping_system_samples_keep_their_own_window():
+    """Test concurrent CPU samples with different windows don't cut each other.
+
+    Every sample must measure over its own interval rather than relying on a
+    cpu_percent(interval=None) baseline that another request can reset.
+    """
+    intervals = []
+
+    def fake_cpu_percent(interval=None, percpu=False):
+        intervals.append(interval)
+        time.sleep(interval or 0)
+        # Report the window length so each result shows which window it covers
+        return [interval * 100] * 2 if percpu else interval * 100
+
+    with patch("psutil.cpu_percent", side_effect=fake_cpu_percent):
+        long_sample, short_sample = await asyncio.gather(
+            debug._sample_system_info(False, 0.2, False),
+            debug._sample_system_info(False, 0.05, True),
+        )
+
+    assert None not in intervals
+    assert long_sample["cpu"]["cpu_percent"] == pytest.approx(20.0)
+    assert long_sample["cpu"]["per_cpu_percent"] is None
+    assert short_sample["cpu"]["cpu_percent"] == pytest.approx(5.0)
+    assert short_sample["cpu"]["per_cpu_percent"] == pytest.approx([5.0, 5.0])
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_drops_expired_keys():
+    """Test expired payloads and their locks are not kept forever."""
+    cache = debug._TTLCache()
+
+    async def compute():
+        return {"sample": 1}
+
+    for key in range(5):
+        await cache.get_or_compute(key, 0.0, compute)
+    await cache.get_or_compute("live", 60.0, compute)
+
+    assert list(cache._entries) == ["live"]
+    assert list(cache._locks) == ["live"]
+
+
+@pytest.fixture
+def nvml_state():
+    """Reset the cached NVML state around a test."""
+    with (
+        patch.object(debug, "_nvml_handles", None),
+        patch.object(debug, "_nvml_failed", False),
+        patch.object(debug, "NVML_AVAILABLE", True),
+        patch.object(debug.atexit, "register") as mock_register,
+    ):
+        yield mock_register
+
+
+def _fake_gputil():
+    gpu = SimpleNamespace(
+        id=0,
+        name="GPU",
+        load=0.5,
+        memoryTotal=1000.0,
+        memoryUsed=250.0,
+        memoryFree=750.0,
+        temperature=40,
+    )
+    return SimpleNamespace(getGPUs=lambda: [gpu])
+
+
+def test_nvml_init_failure_falls_back_to_gputil(nvml_state):
+    """Test a failed nvmlInit is remembered and GPUtil serves the stats."""
+    pynvml = MagicMock()
+    pynvml.nvmlInit.side_effect = RuntimeError("Driver Not Loaded")
+
+    with (
+        patch.object(debug, "pynvml", pynvml, create=True),
+        patch.object(debug, "GPUtil", _fake_gputil(), create=True),
+        patch.object(debug, "GPUTIL_AVAILABLE", True),
+    ):
+        for _ in range(2):
+            gpus = debug._read_gpus()
+            assert gpus[0]["memory"]["percent"] == 25.0
+
+    assert pynvml.nvmlInit.call_count == 1
+    pynvml.nvmlShutdown.assert_not_called()
+    nvml_state.assert_not_called()
+
+
+def test_nvml_lookup_failure_shuts_nvml_down(nvml_state):
+    """Test a failure after nvmlInit shuts NVML down once and falls back."""
+    pynvml = MagicMock()
+    pynvml.nvmlDeviceGetCount.side_effect = RuntimeError("lookup failed")
+
+    with (
+        patch.object(debug, "pynvml", pynvml, create=True),
+        patch.object(debug, "GPUtil", _fake_gputil(), create=True),
+        patch.object(debug, "GPUTIL_AVAILABLE", True),
+    ):
+        assert debug._read_gpus()[0]["name"] == "GPU"
+        assert debug._read_gpus()[0]["name"] == "GPU"
+
+    assert pynvml.nvmlInit.call_count == 1
+    assert pynvml.nvmlShutdown.call_count == 1
+    nvml_state.assert_not_called()
+
+
+def test_nvml_failure_without_gputil_reports_no_gpu(nvml_state):
+    """Test a driverless host without GPUtil still reports "gpu" as None."""
+    pynvml = MagicMock()
+    pynvml.nvmlInit.side_effect = RuntimeError("Driver Not Loaded")
+
+    with (
+        patch.object(debug, "pynvml", pynvml, create=True),
+        patch.object(debug, "GPUTIL_AVAILABLE", False),
+        patch.object(debug, "GPU_AVAILABLE", True),
+        patch.object(debug, "_gpu_snapshot_cache", {"ts": None, "value": None}),
+    ):
+        assert debug._read_gpus() is None
+        assert debug._collect_system_info(False, 0.0, None)["gpu"] is None
+
+
+@pytest.mark.asyncio
+async def test_model_pool_info_uninitialized():
+    """Test the model pool endpoint doesn't create the pool on demand."""
+    with patch.object(InstancePool, "_instance", None):
+        assert await debug.get_model_pool_info() == {"initialized": False}
+
+
+@pytest.mark.asyncio
+async def test_model_pool_info_reports_busy_instances_and_queue():
+    """Test busy counts and queue depth come from one pool snapshot."""
+    pool = InstancePool()
+    pool.instances = [GPUInstance(0, 0), GPUInstance(0, 1), GPUInstance(1, 0)]
+    pool.instances[1].is_busy = True
+    pool.request_queue.put_nowait("request1")
+    pool.request_queue.put_nowait("request2")
+
+    assert pool.snapshot() == [(0, 0, False), (1, 0, True), (0, 1, False)]
+
+    with patch.object(InstancePool, "_instance", pool):
+        info = await debug.get_model_pool_info()
+
+    assert info == {
+        "initialized": True,
+        "total_instances": 3,
+        "busy_instances": 1,
+        "queued_requests": 2,
+        "instances": [
+            {"instance_id": 0, "device_id": 0, "busy": False},
+            {"instance_id": 1, "device_id": 0, "busy": True},
+            {"instance_id": 0, "device_id": 1, "busy": False},
+        ],
+    }
@@ -2,6 +2,7 @@ import os
 from unittest.mock import patch
 
 import pytest
+import torch
 
 from api.src.core.paths import (
     _find_file,
@@ -10,6 +11,7 @@ from api.src.core.paths import (
     get_temp_dir_size,
     get_temp_file_path,
     list_temp_files,
+    save_voice_tensor,
 )
 
 
@@ -136,3 +138,20 @@ async def test_get_temp_dir_size():
 
         size = await get_temp_dir_size()
         assert size == 1024
+
+
+@pytest.mark.asyncio
+async def test_save_voice_tensor_replaces_atomically(tmp_path):
+    """Test saving swaps in a complete file and leaves no temp files behind."""
+    voice_path = tmp_path / "voice.pt"
+    voice_path.write_bytes(b"old")
+
+    await save_voice_tensor(torch.ones(3), str(voice_path))
+    assert torch.equal(torch.load(voice_path), torch.ones(3))
+    assert os.listdir(tmp_path) == ["voice.pt"]
+
+    with patch("torch.save", side_effect=OSError("disk full")):
+        with pytest.raises(RuntimeError, match="Failed to save voice tensor"):
+            await save_voice_tensor(torch.zeros(3), str(voice_path))
+    assert torch.equal(torch.load(voice_path), torch.ones(3))
+    assert os.listdir(tmp_path) == ["voice.pt"]
@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 import torch
 
-from api.src.services.tts_service import TTSService
+from api.src.services.tts_service import TTSService, _parse_voice_formula
 
 
 @pytest.fixture
@@ -81,7 +81,7 @@ async def test_get_voice_path_single():
 
 
 @pytest.mark.asyncio
-async def test_get_voice_path_combined():
+async def test_get_voice_path_combined(tmp_path):
     """Test getting path for combined voices."""
     model_manager = AsyncMock()
     voice_manager = AsyncMock()
@@ -96,7 +96,7 @@ async def test_get_voice_path_combined():
     ):
         mock_get_model.return_value = model_manager
         mock_get_voice.return_value = voice_manager
-        mock_temp.return_value = "/tmp"
+        mock_temp.return_value = str(tmp_path)
         mock_load.return_value = torch.ones(10)
 
         service = await TTSService.create("test_output")
@@ -106,6 +106,32 @@ async def test_get_voice_path_combined():
         mock_save.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_voice_path_combined_keeps_weight_precision(tmp_path):
+    """Test close but different weights never share a combined voice file."""
+    model_manager = AsyncMock()
+    voice_manager = AsyncMock()
+    voice_manager.get_voice_path.return_value = "/path/to/voice.pt"
+
+    with (
+        patch("api.src.services.tts_service.get_model_manager") as mock_get_model,
+        patch("api.src.services.tts_service.get_voice_manager") as mock_get_voice,
+        patch("torch.load") as mock_load,
+        patch("torch.save"),
+        patch("tempfile.gettempdir") as mock_temp,
+    ):
+        mock_get_model.return_value = model_manager
+        mock_get_voice.return_value = voice_manager
+        mock_temp.return_value = str(tmp_path)
+        mock_load.side_effect = lambda *args, **kwargs: torch.ones(10)
+
+        service = await TTSService.create("test_output")
+        _, path_a = await service._get_voice_path("voice2+voice1(0.1234567)")
+        _, path_b = await service._get_voice_path("voice1(0.1234568)+voice2")
+        assert path_a.endswith("voice1(0.1234567)+voice2.pt")
+        assert path_a != path_b
+
+
 @pytest.mark.asyncio
 async def test_list_voices():
     """Test listing available voices."""
@@ -124,3 +150,24 @@ async def test_list_voices():
         voices = await service.list_voices()
         assert voices == ["voice1", "voice2"]
         voice_manager.list_voices.assert_called_once()
+
+
+def test_parse_voice_formula():
+    """Test parsing combined voice names with optional weights."""
+    assert _parse_voice_formula("voice1+voice2") == [
+        ("voice1", 1.0),
+        ("voice2", 1.0),
+    ]
+    assert _parse_voice_formula("voice1(2) + voice2(0.5)") == [
+        ("voice1", 2.0),
+        ("voice2", 0.5),
+    ]
+    assert _parse_voice_formula("af_bella(1e-3)+af_sky(.5)") == [
+        ("af_bella", 0.001),
+        ("af_sky", 0.5),
+    ]
+
+    with pytest.raises(RuntimeError, match="Invalid combined voice name"):
+        _parse_voice_formula("voice1(x)+voice2")
+    with pytest.raises(RuntimeError, match="Invalid combined voice name"):
+        _parse_voice_formula("voice1(1.2.3)+voice2")
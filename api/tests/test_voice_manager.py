@@ -0,0 +1,118 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import torch
+
+from api.src.inference.voice_manager import VoiceManager
+
+
+@pytest.fixture
+def voice_manager(tmp_path):
+    """Create VoiceManager backed by a temporary voices directory."""
+    for name in ("voice1", "voice2", "voice3"):
+        torch.save(torch.ones(1), tmp_path / f"{name}.pt")
+
+    with (
+        patch("api.src.inference.voice_manager.settings") as mock_settings,
+        patch("api.src.inference.voice_manager._VOICES_DIR", str(tmp_path)),
+    ):
+        mock_settings.use_gpu = False
+        yield VoiceManager()
+
+
+@pytest.mark.asyncio
+async def test_get_voice_path(voice_manager, tmp_path):
+    """Test resolving voice path from the voice index."""
+    path = await voice_manager.get_voice_path("voice1")
+    assert path == str(tmp_path / "voice1.pt")
+
+    with pytest.raises(FileNotFoundError):
+        await voice_manager.get_voice_path("missing")
+
+
+@pytest.mark.asyncio
+async def test_list_voices(voice_manager):
+    """Test listing voices from the voices directory."""
+    assert await voice_manager.list_voices() == ["voice1", "voice2", "voice3"]
+
+
+@pytest.mark.asyncio
+async def test_load_voice_lru_eviction(voice_manager):
+    """Test cache keeps recently used voices and evicts the oldest."""
+    with (
+        patch(
+            "api.src.core.paths.load_voice_tensor", new_callable=AsyncMock
+        ) as mock_load,
+        patch("api.src.inference.voice_manager.model_config") as mock_config,
+    ):
+        mock_load.side_effect = lambda *args, **kwargs: torch.ones(1)
+        mock_config.cache_voices = True
+        mock_config.voice_cache_size = 2
+
+        await voice_manager.load_voice("voice1")
+        await voice_manager.load_voice("voice2")
+        await voice_manager.load_voice("voice1")  # voice1 becomes most recent
+        await voice_manager.load_voice("voice3")  # evicts voice2
+        assert mock_load.call_count == 3
+
+        await voice_manager.load_voice("voice1")
+        assert mock_load.call_count == 3
+        await voice_manager.load_voice("voice2")
+        assert mock_load.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_single_read(voice_manager):
+    """Test concurrent requests for the same voice trigger one load."""
+
+    async def slow_load(voice_path, **kwargs):
+        await asyncio.sleep(0.01)
+        return torch.ones(1)
+
+    with patch(
+        "api.src.core.paths.load_voice_tensor", side_effect=slow_load
+    ) as mock_load:
+        results = await asyncio.gather(
+            voice_manager.load_voice("voice1"), voice_manager.load_voice("voice1")
+        )
+        assert mock_load.call_count == 1
+        assert results[0] is results[1]
+
+
+@pytest.mark.asyncio
+async def test_combine_voices_order_independent_cache(voice_manager):
+    """Test "a+b" and "b+a" are served from the same cache entry."""
+    with (
+        patch(
+            "api.src.core.paths.load_voice_tensor", new_callable=AsyncMock
+        ) as mock_load,
+        patch("api.src.inference.voice_manager.model_config") as mock_config,
+    ):
+        mock_load.side_effect = [torch.ones(2), torch.full((2,), 3.0)]
+        mock_config.cache_voices = True
+        mock_config.voice_cache_size = 3
+
+        combined = await voice_manager.combine_voices(["voice1", "voice2"])
+        assert torch.equal(combined, torch.full((2,), 2.0))
+
+        assert await voice_manager.combine_voices(["voice2", "voice1"]) is combined
+        assert mock_load.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_combined_voice_not_loadable_by_name(voice_manager):
+    """Test a cached blend does not make "a+b" resolve as a single voice."""
+    with (
+        patch(
+            "api.src.core.paths.load_voice_tensor", new_callable=AsyncMock
+        ) as mock_load,
+        patch("api.src.inference.voice_manager.model_config") as mock_config,
+    ):
+        mock_load.side_effect = lambda *args, **kwargs: torch.ones(2)
+        mock_config.cache_voices = True
+        mock_config.voice_cache_size = 3
+
+        await voice_manager.combine_voices(["voice1", "voice2"])
+        with pytest.raises(RuntimeError):
+            await voice_manager.load_voice("voice1+voice2")